@@ -0,0 +1,160 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Compiled multi-threaded blackjack experiment.
+
+MIT License
+
+Copyright (c) 2025 Florian Krellner
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import numpy as np
+from cython.parallel import prange, threadid
+from libc.stdint cimport uint64_t
+from libc.string cimport memcpy
+
+cdef enum:
+    WIN = 0
+    LOSE = 1
+    DRAW = 2
+    N_UPCARDS = 12  # Columns of the hit table, indexed by the dealer upcard value
+
+
+cdef inline uint64_t _rotl(uint64_t x, int k) noexcept nogil:
+    return (x << k) | (x >> (64 - k))
+
+
+cdef inline uint64_t _next(uint64_t* s) noexcept nogil:
+    """Advance a xoshiro256** generator state and return the next random number."""
+    cdef uint64_t result = _rotl(s[1] * 5, 7) * 9
+    cdef uint64_t t = s[1] << 17
+    s[2] ^= s[0]
+    s[3] ^= s[1]
+    s[1] ^= s[2]
+    s[0] ^= s[3]
+    s[2] ^= t
+    s[3] = _rotl(s[3], 45)
+    return result
+
+
+cdef inline int _deal(signed char* cards, int n_cards, int* cursor, uint64_t* s) noexcept nogil:
+    """Deal the next card, shuffling lazily with one Fisher-Yates step per card."""
+    cdef int i = cursor[0]
+    cdef int j = i + <int>(_next(s) % <uint64_t>(n_cards - i))  # Modulo bias is negligible for decks this small
+    cdef signed char card = cards[j]
+    cards[j] = cards[i]
+    cards[i] = card
+    cursor[0] = i + 1
+    return card
+
+
+cdef inline void _add_card(int* value, int* aces, int card) noexcept nogil:
+    """Add a card to a running hand value and number of aces still counted as 11."""
+    cdef int soften
+    value[0] += card
+    if card == 11:
+        aces[0] += 1
+
+    # Adjust for Aces if value exceeds 21, each softened ace takes off 10
+    if value[0] > 21:
+        soften = min(aces[0], (value[0] - 12) // 10)
+        value[0] -= 10 * soften
+        aces[0] -= soften
+
+
+cdef int _run_one(signed char* cards, int n_cards, const unsigned char* hit_table, uint64_t* s) noexcept nogil:
+    """Play a round of blackjack in a single pass over the deck and return the result code."""
+    cdef int cursor = 0
+    cdef int player_value = 0, player_aces = 0, dealer_value = 0, dealer_aces = 0
+    cdef int dealer_upcard
+
+    _add_card(&player_value, &player_aces, _deal(cards, n_cards, &cursor, s))
+    _add_card(&player_value, &player_aces, _deal(cards, n_cards, &cursor, s))
+    dealer_upcard = _deal(cards, n_cards, &cursor, s)
+    _add_card(&dealer_value, &dealer_aces, dealer_upcard)
+    _add_card(&dealer_value, &dealer_aces, _deal(cards, n_cards, &cursor, s))
+
+    # Player's turn
+    while player_value <= 21 and hit_table[player_value * N_UPCARDS + dealer_upcard]:
+        _add_card(&player_value, &player_aces, _deal(cards, n_cards, &cursor, s))
+
+    # Dealer's turn
+    while dealer_value < 17:
+        _add_card(&dealer_value, &dealer_aces, _deal(cards, n_cards, &cursor, s))
+
+    if player_value > 21:
+        return LOSE
+    elif dealer_value > 21 or player_value > dealer_value:
+        return WIN
+    elif player_value < dealer_value:
+        return LOSE
+    else:
+        return DRAW
+
+
+def experiment_fast(Py_ssize_t n_runs, const signed char[::1] deck, const unsigned char[:, ::1] hit_table,
+                    uint64_t[:, ::1] states, Py_ssize_t chunk_size, int n_threads) -> dict:
+    """Run multiple games of blackjack on OpenMP threads without holding the GIL.
+
+    Games are split into chunks of chunk_size games with one generator state each. Every chunk
+    starts from the unshuffled deck, so the results do not depend on the number of threads.
+
+    Args:
+        n_runs (int): Number of games to run.
+        deck (np.ndarray): int8 card values of the combined decks.
+        hit_table (np.ndarray): uint8 hit table indexed by (player value, dealer upcard), 12 columns.
+        states (np.ndarray): uint64 xoshiro256** states of shape (n_chunks, 4), one row per chunk of games.
+        chunk_size (int): Number of games per chunk, states must cover ceil(n_runs / chunk_size) chunks.
+        n_threads (int): Number of threads.
+    Returns:
+        dict: Statistics of wins, losses, and draws.
+    """
+    if hit_table.shape[1] != N_UPCARDS:
+        raise ValueError(f"Hit table needs {N_UPCARDS} columns, got {hit_table.shape[1]}")
+    if states.shape[0] * chunk_size < n_runs:
+        raise ValueError(f"{states.shape[0]} generator states do not cover {n_runs} games in chunks of {chunk_size}")
+
+    cdef Py_ssize_t n_chunks = (n_runs + chunk_size - 1) // chunk_size
+    cdef int n_cards = deck.shape[0]
+    cdef signed char[:, ::1] decks = np.empty((n_threads, n_cards), dtype=np.int8)  # One deck buffer per thread
+    cdef Py_ssize_t chunk, i
+    cdef int result
+    cdef signed char* cards
+    cdef Py_ssize_t chunk_win, chunk_lose, chunk_draw
+    cdef Py_ssize_t win = 0, lose = 0, draw = 0
+
+    for chunk in prange(n_chunks, nogil=True, num_threads=n_threads, schedule='dynamic'):
+        cards = &decks[threadid(), 0]
+        memcpy(cards, &deck[0], n_cards)
+        chunk_win = 0
+        chunk_lose = 0
+        chunk_draw = 0
+        for i in range(chunk * chunk_size, min((chunk + 1) * chunk_size, n_runs)):
+            result = _run_one(cards, n_cards, &hit_table[0, 0], &states[chunk, 0])
+            if result == WIN:
+                chunk_win = chunk_win + 1
+            elif result == LOSE:
+                chunk_lose = chunk_lose + 1
+            else:
+                chunk_draw = chunk_draw + 1
+        win += chunk_win
+        lose += chunk_lose
+        draw += chunk_draw
+
+    return {'win': win, 'lose': lose, 'draw': draw}
@@ -0,0 +1,46 @@
+# cython: language_level=3
+"""Compiled hand value calculation for blackjack strategies.
+
+MIT License
+
+Copyright (c) 2025 Florian Krellner
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+cpdef int calculate_hand_value(hand) except -1:
+    """Calculate the value of a hand in blackjack.
+
+    Args:
+        hand (list): List of card values in the hand (11 for an ace).
+    Returns:
+        int: Total value of the hand.
+    """
+    cdef int card
+    cdef int value = 0  # Aces are initially counted as 11
+    cdef int aces = 0
+
+    for card in hand:
+        value += card
+        aces += card == 11
+
+    # Adjust for Aces if value exceeds 21, each softened ace takes off 10
+    if value > 21:
+        value -= 10 * min(aces, (value - 12) // 10)
+    return value
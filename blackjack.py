@@ -23,59 +23,389 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-import random, argparse
-from blackjack_strategies import PlayerStrategy
+import argparse, os
+from collections import Counter
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from blackjack_strategies import PlayerStrategy, BASIC_HIT_TABLE, HIT_TABLES, hit_row
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:  # Numba is optional, fall back to plain Python loops
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    prange = range
+
+try:
+    from _experiment import experiment_fast as _experiment_fast
+except ImportError:  # Compiled extension not built, experiment_fast falls back to experiment_jit
+    _experiment_fast = None
+
+CARD_VALUES = (2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 11)  # One suit, J/Q/K count 10 and the ace 11
+CARD_DECK = CARD_VALUES * 4  # Standard 52-card deck
+CARD_RANKS = ('', '', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'A')  # Display names indexed by card value
+
+# A hand that hits below 17 holds at most 17 cards (every card adds at least 1 to the hard total),
+# so player (2 + 15 hits) and dealer (2 + 15 hits) never reach past this many cards of the deck.
+MAX_CARDS_PER_GAME = 34
+
+RESULTS = ('win', 'lose', 'draw')  # Game results indexed by the result codes of the compiled core
+WIN, LOSE, DRAW = range(3)
+JIT_CHUNK_SIZE = 10_000  # Games per independently seeded chunk of the compiled experiments
+
+PRINT = print  # Module-level alias used by the verbose game loop
+
+N_RANKS = 10  # Distinct card values 2..11, rank index is the card value minus 2
+DEALER_FINAL_VALUES = (17, 18, 19, 20, 21, 22)  # Possible final dealer values, 22 stands for bust
+DEALER_CACHE_SIZE = 1 << 14  # Dealer distributions cached across dealer_distribution calls, least recently used are evicted
+
+# Deck states pack the count of every rank into one integer, rank r occupying bits [b * r, b * r + b)
+# for b bits per rank. Eight bits hold the 16 ten-valued cards per deck for up to 15 decks, larger
+# shoes get wider fields, see rank_bits.
+RANK_BITS = 8
+
+
+def format_hand(hand: list) -> str:
+    """Format a hand of integer cards for display.
+
+    Args:
+        hand (list): List of card values in the hand.
+    Returns:
+        str: Human-readable hand, e.g. '[10, A]'.
+    """
+    return '[' + ', '.join(CARD_RANKS[card] for card in hand) + ']'
+
+
+def rank_bits(n_card_decks: int) -> int:
+    """Number of bits per rank needed to pack the card counts of n_card_decks decks.
+
+    Args:
+        n_card_decks (int): Number of decks in the shoe.
+    Returns:
+        int: Bits per rank, at least RANK_BITS.
+    """
+    return max(RANK_BITS, (CARD_DECK.count(10) * n_card_decks).bit_length())
+
+
+def pack_counts(counts, bits: int = RANK_BITS) -> int:
+    """Pack per-rank card counts into a deck state integer.
+
+    Args:
+        counts (iterable): Number of cards per rank (card values 2..11).
+        bits (int, optional): Bits per rank. Defaults to RANK_BITS.
+    Returns:
+        int: Packed deck state.
+    """
+    state = 0
+    for rank, count in enumerate(map(int, counts)):
+        if not 0 <= count < 1 << bits:
+            raise ValueError(f"Card count {count} of rank {rank + 2} does not fit into {bits} bits")
+        state |= count << (bits * rank)
+    return state
+
+
+def unpack_counts(state: int, bits: int = RANK_BITS) -> tuple:
+    """Unpack a deck state integer into per-rank card counts.
+
+    Args:
+        state (int): Packed deck state.
+        bits (int, optional): Bits per rank. Defaults to RANK_BITS.
+    Returns:
+        tuple: Number of cards per rank (card values 2..11).
+    """
+    mask = (1 << bits) - 1
+    return tuple((state >> (bits * rank)) & mask for rank in range(N_RANKS))
+
+
+def _hand_values(totals: np.ndarray, aces: np.ndarray) -> np.ndarray:
+    """Vectorized hand value calculation from raw card sums and ace counts.
+
+    Args:
+        totals (np.ndarray): Sums of the card values, aces counted as 11.
+        aces (np.ndarray): Number of aces in each hand.
+    Returns:
+        np.ndarray: Hand values with aces softened to 1 where needed.
+    """
+    # Adjust for Aces if value exceeds 21, each softened ace takes off 10
+    return totals - 10 * np.minimum(aces, np.maximum(totals - 12, 0) // 10)
+
+
+def _add_card(value: int, aces: int, card: int) -> tuple:
+    """Add a card to a running hand value.
+
+    Args:
+        value (int): Current value of the hand.
+        aces (int): Number of aces in the hand still counted as 11.
+        card (int): Value of the added card.
+    Returns:
+        tuple: New hand value and number of aces still counted as 11.
+    """
+    value += card
+    aces += card == 11
+
+    # Adjust for Aces if value exceeds 21, each softened ace takes off 10
+    if value > 21:
+        soften = min(aces, (value - 12) // 10)
+        value -= 10 * soften
+        aces -= soften
+    return value, aces
+
+
+def _draws(state: int, n_cards: int, bits: int):
+    """Iterate over the ranks that can be drawn from a deck state.
+
+    Args:
+        state (int): Packed counts of the unseen cards.
+        n_cards (int): Number of unseen cards.
+        bits (int): Bits per rank of the packed state.
+    Yields:
+        tuple: Card value, probability of drawing it and the deck state after the draw.
+    """
+    mask = (1 << bits) - 1
+    for rank in range(N_RANKS):
+        shift = bits * rank
+        count = (state >> shift) & mask
+        if count:
+            yield rank + 2, count / n_cards, state - (1 << shift)
+
+
+def _hit_table_2d(hit_table: np.ndarray) -> np.ndarray:
+    """Expand a hit table to the (player value, dealer upcard) layout of the compiled cores.
+
+    Args:
+        hit_table (np.ndarray): Boolean table indexed by player value, or by (player value, dealer upcard).
+    Returns:
+        np.ndarray: Contiguous boolean table indexed by (player value, dealer upcard).
+    """
+    if hit_table.ndim == 1:
+        hit_table = np.repeat(hit_table[:, None], CARD_VALUES[-1] + 1, axis=1)
+    return np.ascontiguousarray(hit_table, dtype=np.bool_)
+
+
+@lru_cache(maxsize=DEALER_CACHE_SIZE)
+def _dealer_distribution(upcard: int, state: int, n_cards: int, bits: int) -> tuple:
+    """Compute the dealer's final value distribution for an upcard and unseen deck state.
+
+    Only the DEALER_CACHE_SIZE most recently used distributions are kept, the memo of the
+    underlying recursion lives for a single computation.
+
+    Args:
+        upcard (int): Dealer's visible card value.
+        state (int): Packed counts of the unseen cards.
+        n_cards (int): Number of unseen cards.
+        bits (int): Bits per rank of the packed state.
+    Returns:
+        tuple: Probabilities of the final values in DEALER_FINAL_VALUES.
+    """
+    return _dealer_dp(upcard, int(upcard == 11), state, n_cards, bits, {})
+
+
+def _dealer_dp(value: int, aces: int, state: int, n_cards: int, bits: int, memo: dict) -> tuple:
+    """Recursively compute the dealer's final value distribution, memoized per state.
+
+    Args:
+        value (int): Current value of the dealer's hand.
+        aces (int): Number of aces still counted as 11.
+        state (int): Packed counts of the unseen cards.
+        n_cards (int): Number of unseen cards.
+        bits (int): Bits per rank of the packed state.
+        memo (dict): Memoized distributions of already visited states.
+    Returns:
+        tuple: Probabilities of the final values in DEALER_FINAL_VALUES.
+    """
+    key = (value, aces, state)
+    if key in memo:
+        return memo[key]
+
+    distribution = [0.0] * len(DEALER_FINAL_VALUES)
+    for card, weight, remaining in _draws(state, n_cards, bits):
+        new_value, new_aces = _add_card(value, aces, card)
+        if new_value >= 17:
+            distribution[min(new_value, 22) - 17] += weight
+        else:
+            for i, probability in enumerate(_dealer_dp(new_value, new_aces, remaining, n_cards - 1, bits, memo)):
+                distribution[i] += weight * probability
+
+    memo[key] = distribution = tuple(distribution)
+    return distribution
+
+
+def _strategy_hits(player_strategy: callable, dealer_upcard: int):
+    """Look up the hit decisions of a strategy with a hit table.
+
+    Args:
+        player_strategy (callable): Function that determines player's actions.
+        dealer_upcard (int): Dealer's visible card value.
+    Returns:
+        np.ndarray: Boolean hit decisions indexed by the player's hand value, None if the
+            strategy has no hit table and has to be called with the hand.
+    """
+    hit_table = getattr(player_strategy, 'hit_table', None)
+    if hit_table is None:
+        try:
+            hit_table = HIT_TABLES.get(player_strategy)
+        except TypeError:  # Unhashable strategies cannot be registered, they are called with the hand
+            pass
+    return None if hit_table is None else hit_row(hit_table, dealer_upcard)
+
+
+_add_card_core = njit(cache=True)(_add_card)  # Compiled variant for use inside the compiled core
+
+
+@njit(cache=True, boundscheck=False)
+def _play_fused(cards: np.ndarray, hit_table: np.ndarray) -> int:
+    """Play a round of blackjack in a single pass over a shuffled deck.
+
+    The first two cards go to the player and the next two to the dealer, then the player
+    hits from the following cards and the dealer from the cards after those. Only the
+    running value and number of soft aces of both hands are tracked.
+
+    Args:
+        cards (np.ndarray): Shuffled card values.
+        hit_table (np.ndarray): Boolean hit table indexed by (player value, dealer upcard).
+    Returns:
+        int: Result code (WIN, LOSE or DRAW).
+    """
+    player_value, player_aces = _add_card_core(0, 0, cards[0])
+    player_value, player_aces = _add_card_core(player_value, player_aces, cards[1])
+    dealer_value, dealer_aces = _add_card_core(0, 0, cards[2])
+    dealer_value, dealer_aces = _add_card_core(dealer_value, dealer_aces, cards[3])
+    dealer_upcard = cards[2]
+    cursor = 4
+
+    # Player's turn
+    while player_value <= 21 and hit_table[player_value, dealer_upcard]:
+        player_value, player_aces = _add_card_core(player_value, player_aces, cards[cursor])
+        cursor += 1
+
+    # Dealer's turn
+    while dealer_value < 17:
+        dealer_value, dealer_aces = _add_card_core(dealer_value, dealer_aces, cards[cursor])
+        cursor += 1
+
+    if player_value > 21:
+        return LOSE
+    elif dealer_value > 21 or player_value > dealer_value:
+        return WIN
+    elif player_value < dealer_value:
+        return LOSE
+    else:
+        return DRAW
+
+
+@njit(cache=True, parallel=True)
+def _experiment_core(deck: np.ndarray, n_runs: int, hit_table: np.ndarray, seeds: np.ndarray) -> np.ndarray:
+    """Play n_runs games in parallel, each on a freshly shuffled copy of the deck.
+
+    Games are split into one chunk of JIT_CHUNK_SIZE games per seed. Every chunk reseeds the
+    generator of the thread running it, so the results do not depend on the thread scheduling.
+
+    Args:
+        deck (np.ndarray): Card values of the combined decks.
+        n_runs (int): Number of games to run.
+        hit_table (np.ndarray): Boolean hit table indexed by (player value, dealer upcard).
+        seeds (np.ndarray): One 32-bit seed per chunk of games.
+    Returns:
+        np.ndarray: Result code of every game.
+    """
+    outcomes = np.empty(n_runs, dtype=np.int8)
+    for chunk in prange(len(seeds)):
+        np.random.seed(seeds[chunk])
+        for i in range(chunk * JIT_CHUNK_SIZE, min((chunk + 1) * JIT_CHUNK_SIZE, n_runs)):
+            cards = deck.copy()
+            np.random.shuffle(cards)
+            outcomes[i] = _play_fused(cards, hit_table)
+    return outcomes
+
+
+if not HAS_NUMBA:
+    def _experiment_core(deck: np.ndarray, n_runs: int, hit_table: np.ndarray, seeds: np.ndarray) -> np.ndarray:
+        """Plain Python variant of _experiment_core, shuffling with one Generator per chunk of games.
+
+        Unlike the compiled variant it leaves NumPy's global generator untouched.
+
+        Args:
+            deck (np.ndarray): Card values of the combined decks.
+            n_runs (int): Number of games to run.
+            hit_table (np.ndarray): Boolean hit table indexed by (player value, dealer upcard).
+            seeds (np.ndarray): One 32-bit seed per chunk of games.
+        Returns:
+            np.ndarray: Result code of every game.
+        """
+        outcomes = np.empty(n_runs, dtype=np.int8)
+        for chunk, seed in enumerate(seeds):
+            rng = np.random.default_rng(seed)
+            for i in range(chunk * JIT_CHUNK_SIZE, min((chunk + 1) * JIT_CHUNK_SIZE, n_runs)):
+                outcomes[i] = _play_fused(rng.permutation(deck), hit_table)
+        return outcomes
 
-CARD_DECK = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A'] * 4  # Standard 52-card deck
 
 class BlackjackGame:
 
-    def __init__(self, n_card_decks: int, logging=True) -> None:
+    def __init__(self, n_card_decks: int, logging=True, seed=None) -> None:
         """Initialize a game of blackjack with n_card_decks decks of cards.
 
         Args:
             n_card_decks (int): Number of decks to use in the game.
             logging (bool, optional): Whether to log game events. Defaults to True.
+            seed (optional): Seed or SeedSequence for the game's PCG64 generator. Defaults to None.
         """
         self.n_card_decks = n_card_decks
-        self.logging = logging
-
-        # Create and shuffle the combined decks
-        self.cards = CARD_DECK * self.n_card_decks
-        random.shuffle(self.cards)
-
-    def deal_card(self) -> str:
+        self.logging = logging  # Also binds play, see the logging setter
+
+        # Create and shuffle the combined decks, cards are dealt by advancing a cursor
+        self._deck = np.array(CARD_DECK * self.n_card_decks, dtype=np.int8)
+        self._cursor = 0
+        self._rng = np.random.default_rng(seed)
+        self._rng.shuffle(self._deck)
+
+        # Rank counts of the full shoe, plain and packed
+        self._deck_counts = np.array([CARD_DECK.count(card) * self.n_card_decks for card in range(2, 2 + N_RANKS)])
+        self._rank_bits = rank_bits(self.n_card_decks)
+        self._deck_state = pack_counts(self._deck_counts, self._rank_bits)
+
+    @property
+    def logging(self) -> bool:
+        """Whether to log game events."""
+        return self._logging
+
+    @logging.setter
+    def logging(self, logging: bool) -> None:
+        # Bind play to the version matching the logging setting, keeping the check off the hot path
+        self._logging = logging
+        self.play = self._play_verbose if logging else self._play_silent
+
+    def deal_card(self) -> int:
         """Deal a single card from the deck.
 
         Returns:
-            str: The dealt card.
+            int: The dealt card value (11 for an ace).
         """
-        return self.cards.pop()
+        card = self._deck[self._cursor]
+        self._cursor += 1
+        return int(card)
     
     def calculate_hand_value(self, hand: list) -> int:
         """Calculate the value of a hand in blackjack.
 
         Args:
-            hand (list): List of cards in the hand.
+            hand (list): List of card values in the hand.
         Returns:
             int: The total value of the hand.
         """        
-        value = 0
-        aces = 0
-
-        for card in hand:
-            if card in ['J', 'Q', 'K']:
-                value += 10
-            elif card == 'A':
-                aces += 1
-                value += 11  # Initially count Ace as 11
-            else:
-                value += int(card)
-
-        # Adjust for Aces if value exceeds 21
-        while value > 21 and aces:
-            value -= 10
-            aces -= 1
+        value = sum(hand)  # Aces are initially counted as 11
+        aces = hand.count(11)
+
+        # Adjust for Aces if value exceeds 21, each softened ace takes off 10
+        if value > 21:
+            value -= 10 * min(aces, (value - 12) // 10)
 
         return value
     
@@ -88,9 +418,17 @@ class BlackjackGame:
         Returns:
             str: Result of the game ('win', 'lose', 'draw').
         """        
-        player_value = self.calculate_hand_value(player_hand)
-        dealer_value = self.calculate_hand_value(dealer_hand)
+        return self.determine_winner_by_value(self.calculate_hand_value(player_hand), self.calculate_hand_value(dealer_hand))
+
+    def determine_winner_by_value(self, player_value: int, dealer_value: int) -> str:
+        """Determine the winner of the game from the final hand values.
 
+        Args:
+            player_value (int): Value of the player's hand.
+            dealer_value (int): Value of the dealer's hand.
+        Returns:
+            str: Result of the game ('win', 'lose', 'draw').
+        """
         if player_value > 21:
             return 'lose'
         elif dealer_value > 21 or player_value > dealer_value:
@@ -99,44 +437,110 @@ class BlackjackGame:
             return 'lose'
         else:
             return 'draw'
-    
+
+    def dealer_distribution(self, upcard: int, state: int) -> np.ndarray:
+        """Probability distribution of the dealer's final hand value.
+
+        The dealer holds the upcard and draws the hole card and all hits from the unseen cards.
+        Results are cached per upcard and unseen deck state.
+
+        Args:
+            upcard (int): Dealer's visible card value.
+            state (int): Packed counts of the unseen cards, see pack_counts and rank_bits.
+        Returns:
+            np.ndarray: Probabilities of the final values in DEALER_FINAL_VALUES.
+        """
+        n_cards = sum(unpack_counts(state, self._rank_bits))
+        return np.array(_dealer_distribution(upcard, state, n_cards, self._rank_bits))
+
     def play(self, player_strategy) -> str:
         """Play a round of blackjack between a player and a dealer.
 
+        Instances bind play directly to the silent or verbose version whenever logging
+        is set, this method only dispatches for unbound calls.
+
         Args:
             player_strategy (callable): Function that determines player's actions.
         Returns:
             str: Result of the game ('win', 'lose', 'draw').
         """ 
+        if self.logging:
+            return self._play_verbose(player_strategy)
+        return self._play_silent(player_strategy)
+
+    def _play_silent(self, player_strategy) -> str:
+        """Play a round of blackjack without logging.
+
+        Args:
+            player_strategy (callable): Function that determines player's actions.
+        Returns:
+            str: Result of the game ('win', 'lose', 'draw').
+        """
+        player_hand = [self.deal_card(), self.deal_card()]
+        dealer_upcard = self.deal_card()
+
+        # Hand values are tracked incrementally as cards are dealt
+        player_value, player_aces = _add_card(*_add_card(0, 0, player_hand[0]), player_hand[1])
+        dealer_value, dealer_aces = _add_card(*_add_card(0, 0, dealer_upcard), self.deal_card())
+
+        # Player's turn
+        hits = _strategy_hits(player_strategy, dealer_upcard)
+        while player_value <= 21 and (hits[player_value] if hits is not None
+                                      else player_strategy(player_hand, dealer_upcard)):
+            card = self.deal_card()
+            player_hand.append(card)
+            player_value, player_aces = _add_card(player_value, player_aces, card)
+
+        # Dealer's turn
+        while dealer_value < 17:
+            dealer_value, dealer_aces = _add_card(dealer_value, dealer_aces, self.deal_card())
+
+        return self.determine_winner_by_value(player_value, dealer_value)
+
+    def _play_verbose(self, player_strategy) -> str:
+        """Play a round of blackjack, logging every card dealt.
+
+        Args:
+            player_strategy (callable): Function that determines player's actions.
+        Returns:
+            str: Result of the game ('win', 'lose', 'draw').
+        """
         player_hand = [self.deal_card(), self.deal_card()]
         dealer_hand = [self.deal_card(), self.deal_card()]
+        dealer_upcard = dealer_hand[0]
 
-        if self.logging:
-            print(f"Player's hand: {player_hand}")
-            print(f"Dealer's upcard: {dealer_hand[0]}, ?")
+        # Hand values are tracked incrementally as cards are dealt
+        player_value, player_aces = _add_card(*_add_card(0, 0, player_hand[0]), player_hand[1])
+
+        PRINT(f"Player's hand: {format_hand(player_hand)}")
+        PRINT(f"Dealer's upcard: {CARD_RANKS[dealer_upcard]}, ?")
 
         # Player's turn
-        while player_strategy(player_hand, dealer_hand[0]):
-            player_hand.append(self.deal_card())
-            if self.logging:
-                print(f"Player hits: {player_hand}")
+        hits = _strategy_hits(player_strategy, dealer_upcard)
+        while player_value <= 21 and (hits[player_value] if hits is not None
+                                      else player_strategy(player_hand, dealer_upcard)):
+            card = self.deal_card()
+            player_hand.append(card)
+            player_value, player_aces = _add_card(player_value, player_aces, card)
+            PRINT(f"Player hits: {format_hand(player_hand)}")
 
         # Dealer's turn
-        while self.calculate_hand_value(dealer_hand) < 17:
-            dealer_hand.append(self.deal_card())
-            if self.logging:
-                print(f"Dealer hits: {dealer_hand}")
+        dealer_value, dealer_aces = _add_card(*_add_card(0, 0, dealer_hand[0]), dealer_hand[1])
+        while dealer_value < 17:
+            card = self.deal_card()
+            dealer_hand.append(card)
+            dealer_value, dealer_aces = _add_card(dealer_value, dealer_aces, card)
+            PRINT(f"Dealer hits: {format_hand(dealer_hand)}")
 
-        if self.logging:
-            print(f"Final Player's hand: {player_hand} (value: {self.calculate_hand_value(player_hand)})")
-            print(f"Final Dealer's hand: {dealer_hand} (value: {self.calculate_hand_value(dealer_hand)})")
+        PRINT(f"Final Player's hand: {format_hand(player_hand)} (value: {player_value})")
+        PRINT(f"Final Dealer's hand: {format_hand(dealer_hand)} (value: {dealer_value})")
 
-        return self.determine_winner(player_hand, dealer_hand)
+        return self.determine_winner_by_value(player_value, dealer_value)
         
     def reset(self) -> None:
-        """Reset the game by reshuffling the decks."""
-        self.cards = CARD_DECK * self.n_card_decks
-        random.shuffle(self.cards)
+        """Reset the game by reshuffling the decks in place."""
+        self._cursor = 0
+        self._rng.shuffle(self._deck)
 
     def experiment(self, n_runs: int, player_strategy: callable) -> dict:
         """Run multiple games of blackjack and collect statistics.
@@ -155,13 +559,240 @@ class BlackjackGame:
             self.reset()
 
         return results
+
+    def experiment_prepared(self, n_runs: int, player_strategy: callable, batch_size: int = 100_000) -> dict:
+        """Run multiple games of blackjack on decks shuffled upfront in batches.
+
+        Instead of reshuffling after every game, a batch of deck copies is shuffled row-wise
+        with a single RNG call and every game is dealt from its own row.
+
+        Args:
+            n_runs (int): Number of games to run.
+            player_strategy (callable): Function that determines player's actions.
+            batch_size (int, optional): Number of decks shuffled at once to bound memory. Defaults to 100_000.
+        Returns:
+            dict: Statistics of wins, losses, and draws.
+        """
+        results = {'win': 0, 'lose': 0, 'draw': 0}
+        deck = self._deck
+
+        try:
+            for start in range(0, n_runs, batch_size):
+                all_decks = np.broadcast_to(deck, (min(batch_size, n_runs - start), len(deck))).copy()
+                self._rng.permuted(all_decks, axis=1, out=all_decks)
+                for row in all_decks:
+                    self._deck = row
+                    self._cursor = 0
+                    result = self.play(player_strategy)
+                    results[result] += 1
+        finally:
+            self._deck = deck
+            self.reset()
+
+        return results
+
+    def experiment_parallel(self, n_runs: int, player_strategy: callable, max_workers=None, seed=None) -> dict:
+        """Run multiple games of blackjack split across worker processes.
+
+        Every worker plays its share of the games on its own game instance, seeded from an
+        independent child of a common SeedSequence.
+
+        Args:
+            n_runs (int): Number of games to run.
+            player_strategy (callable): Picklable function that determines player's actions.
+            max_workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+            seed (optional): Entropy for the common SeedSequence. Defaults to a draw from the game's generator.
+        Returns:
+            dict: Statistics of wins, losses, and draws.
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        chunks = [n_runs // max_workers + (i < n_runs % max_workers) for i in range(max_workers)]
+        if seed is None:
+            seed = int(self._rng.integers(2**63))
+        seeds = np.random.SeedSequence(seed).spawn(max_workers)
+        results = Counter({'win': 0, 'lose': 0, 'draw': 0})
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_experiment_worker, self.n_card_decks, chunk, player_strategy, chunk_seed)
+                       for chunk, chunk_seed in zip(chunks, seeds) if chunk]
+            for future in futures:
+                results.update(future.result())
+
+        return dict(results)
+
+    def experiment_jit(self, n_runs: int, hit_table: np.ndarray = BASIC_HIT_TABLE) -> dict:
+        """Run multiple games of blackjack in compiled code, parallelized over the games.
+
+        Uses Numba when it is installed and falls back to the same loop in plain Python otherwise.
+        The chunk seeds are drawn from the game's generator.
+
+        Args:
+            n_runs (int): Number of games to run.
+            hit_table (np.ndarray, optional): Boolean hit table of the player strategy. Defaults to BASIC_HIT_TABLE.
+        Returns:
+            dict: Statistics of wins, losses, and draws.
+        """
+        seeds = self._rng.integers(2**32, size=-(-n_runs // JIT_CHUNK_SIZE))
+        outcomes = _experiment_core(self._deck, n_runs, _hit_table_2d(hit_table), seeds)
+        counts = np.bincount(outcomes, minlength=len(RESULTS))
+        return {result: int(count) for result, count in zip(RESULTS, counts)}
+
+    def experiment_fast(self, n_runs: int, hit_table: np.ndarray = BASIC_HIT_TABLE, n_threads=None) -> dict:
+        """Run multiple games of blackjack in the Cython extension on threads without the GIL.
+
+        Games are split into chunks of JIT_CHUNK_SIZE games, each dealt with its own xoshiro256**
+        generator seeded from the game's generator, so the results do not depend on n_threads.
+        Falls back to experiment_jit when the extension is not built.
+
+        Args:
+            n_runs (int): Number of games to run.
+            hit_table (np.ndarray, optional): Boolean hit table of the player strategy. Defaults to BASIC_HIT_TABLE.
+            n_threads (int, optional): Number of threads. Defaults to the number of CPUs.
+        Returns:
+            dict: Statistics of wins, losses, and draws.
+        """
+        if _experiment_fast is None:
+            return self.experiment_jit(n_runs, hit_table)
+
+        n_threads = n_threads or os.cpu_count() or 1
+        n_chunks = -(-n_runs // JIT_CHUNK_SIZE)
+        seed_sequence = np.random.SeedSequence(int(self._rng.integers(2**63)))
+        states = seed_sequence.generate_state(4 * max(n_chunks, 1), dtype=np.uint64).reshape(-1, 4)
+        return _experiment_fast(n_runs, self._deck, _hit_table_2d(hit_table).view(np.uint8), states,
+                                JIT_CHUNK_SIZE, n_threads)
+
+    def experiment_vectorized(self, n_runs: int, batch_size: int = 100_000) -> dict:
+        """Run multiple games of blackjack with the basic strategy as NumPy array operations.
+
+        Every game gets its own independently shuffled deck. Player and dealer hands are
+        evaluated for all games at once via cumulative sums along the deck rows.
+
+        Args:
+            n_runs (int): Number of games to run.
+            batch_size (int, optional): Number of games simulated per batch to bound memory. Defaults to 100_000.
+        Returns:
+            dict: Statistics of wins, losses, and draws.
+        """
+        results = {'win': 0, 'lose': 0, 'draw': 0}
+        n_cards = min(len(self._deck), MAX_CARDS_PER_GAME)
+
+        for start in range(0, n_runs, batch_size):
+            n_games = min(batch_size, n_runs - start)
+            decks = self._rng.permuted(np.tile(self._deck, (n_games, 1)), axis=1)[:, :n_cards].astype(np.int16)
+            rows = np.arange(n_games)
+
+            # Player's turn: first two cards, then hits from the fifth card on, stand on >= 17
+            player_cards = np.concatenate((decks[:, :2], decks[:, 4:]), axis=1)
+            player_values = _hand_values(np.cumsum(player_cards, axis=1), np.cumsum(player_cards == 11, axis=1))
+            n_player = np.argmax(player_values[:, 1:] >= 17, axis=1) + 2
+            player_value = player_values[rows, n_player - 1]
+
+            # Dealer's turn: the two dealt cards, then hits from the card after the player's last one
+            hit_positions = np.minimum(n_player[:, None] + 2 + np.arange(n_cards - 2), n_cards - 1)
+            dealer_cards = np.concatenate((decks[:, 2:4], np.take_along_axis(decks, hit_positions, axis=1)), axis=1)
+            dealer_values = _hand_values(np.cumsum(dealer_cards, axis=1), np.cumsum(dealer_cards == 11, axis=1))
+            n_dealer = np.argmax(dealer_values[:, 1:] >= 17, axis=1) + 2
+            dealer_value = dealer_values[rows, n_dealer - 1]
+
+            player_bust = player_value > 21
+            win = ~player_bust & ((dealer_value > 21) | (player_value > dealer_value))
+            lose = player_bust | (~win & (player_value < dealer_value))
+            results['win'] += int(win.sum())
+            results['lose'] += int(lose.sum())
+            results['draw'] += n_games - int(win.sum()) - int(lose.sum())
+
+        return results
+
+    def exact_probabilities(self, hit_table: np.ndarray = BASIC_HIT_TABLE) -> dict:
+        """Compute the exact probabilities of winning, losing and drawing under a fixed strategy.
+
+        Enumerates the player's first two cards and the dealer's upcard, then follows the hit
+        table through every possible draw. Standing hands are resolved against the dealer
+        final value distribution of the remaining deck, memoized for the duration of the call.
+
+        Args:
+            hit_table (np.ndarray, optional): Boolean hit table of the player strategy. Defaults to BASIC_HIT_TABLE.
+        Returns:
+            dict: Probabilities of wins, losses, and draws.
+        """
+        state = self._deck_state
+        n_cards = sum(unpack_counts(state, self._rank_bits))
+        memo = {}
+        dealer_memo = {}
+        probabilities = np.zeros(len(RESULTS))
+
+        # Player's first card, second card and the dealer's upcard, each weighted by its count
+        for first, first_weight, first_state in _draws(state, n_cards, self._rank_bits):
+            for second, second_weight, second_state in _draws(first_state, n_cards - 1, self._rank_bits):
+                for upcard, upcard_weight, remaining in _draws(second_state, n_cards - 2, self._rank_bits):
+                    value, aces = _add_card(*_add_card(0, 0, first), second)
+                    hits = hit_row(hit_table, upcard)
+                    probabilities += first_weight * second_weight * upcard_weight * self._player_dp(
+                        value, aces, upcard, remaining, n_cards - 3, hits, memo, dealer_memo)
+
+        return {result: float(probability) for result, probability in zip(RESULTS, probabilities)}
+
+    def _player_dp(self, value: int, aces: int, upcard: int, state: int, n_cards: int,
+                   hits: np.ndarray, memo: dict, dealer_memo: dict) -> np.ndarray:
+        """Recursively compute the result probabilities from a player state, memoized per state.
+
+        Args:
+            value (int): Current value of the player's hand.
+            aces (int): Number of aces still counted as 11.
+            upcard (int): Dealer's visible card value.
+            state (int): Packed counts of the unseen cards.
+            n_cards (int): Number of unseen cards.
+            hits (np.ndarray): Boolean hit decisions indexed by the player's hand value.
+            memo (dict): Memoized probabilities of already visited states.
+            dealer_memo (dict): Memoized dealer final value distributions, see _dealer_dp.
+        Returns:
+            np.ndarray: Probabilities of the results in RESULTS.
+        """
+        key = (value, aces, upcard, state)
+        if key in memo:
+            return memo[key]
+
+        probabilities = np.zeros(len(RESULTS))
+        if value > 21:
+            probabilities[LOSE] = 1.0
+        elif hits[value]:
+            for card, weight, remaining in _draws(state, n_cards, self._rank_bits):
+                new_value, new_aces = _add_card(value, aces, card)
+                probabilities += weight * self._player_dp(
+                    new_value, new_aces, upcard, remaining, n_cards - 1, hits, memo, dealer_memo)
+        else:
+            # Dealer's final values are 17..21 followed by bust
+            dealer = np.array(_dealer_dp(upcard, int(upcard == 11), state, n_cards, self._rank_bits, dealer_memo))
+            below = max(0, value - 17)  # Dealer values 17..value - 1
+            probabilities[WIN] = dealer[-1] + dealer[:below].sum()
+            if value >= 17:
+                probabilities[DRAW] = dealer[value - 17]
+            probabilities[LOSE] = 1.0 - probabilities[WIN] - probabilities[DRAW]
+
+        memo[key] = probabilities
+        return probabilities
     
 
+def _experiment_worker(n_card_decks: int, n_runs: int, player_strategy: callable, seed) -> dict:
+    """Run an experiment on a fresh game instance, used by experiment_parallel.
+
+    Args:
+        n_card_decks (int): Number of decks to use in the game.
+        n_runs (int): Number of games to run.
+        player_strategy (callable): Function that determines player's actions.
+        seed: Seed or SeedSequence for the game.
+    Returns:
+        dict: Statistics of wins, losses, and draws.
+    """
+    return BlackjackGame(n_card_decks, logging=False, seed=seed).experiment(n_runs, player_strategy)
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Play a game of Blackjack or run multiple simulations.")
     parser.add_argument("--decks", type=int, default=1, help="Number of card decks to use (default: 1)")
     parser.add_argument("--runs", type=int, default=0, help="Number of games to simulate (0 = play a single logged game)")
     parser.add_argument("--no-log", action="store_true", help="Disable logging output for a single game run")
+    parser.add_argument("--exact", action="store_true", help="Compute exact win/lose/draw probabilities instead of simulating")
     args = parser.parse_args()
 
     n_card_decks = args.decks
@@ -169,7 +800,11 @@ if __name__ == "__main__":
     game = BlackjackGame(n_card_decks=n_card_decks, logging=not args.no_log)
     strategy = PlayerStrategy(n_card_decks)
 
-    if args.runs > 1:
+    if args.exact:
+        probabilities = game.exact_probabilities(strategy.hit_table)
+        print(f"Exact probabilities with {n_card_decks} deck(s).")
+        print(f"Wins: {probabilities['win']:.2%} | Losses: {probabilities['lose']:.2%} | Draws: {probabilities['draw']:.2%}")
+    elif args.runs > 1:
         stats = game.experiment(args.runs, strategy)
         total = sum(stats.values())
         win_rate = stats['win'] / total if total else 0.0
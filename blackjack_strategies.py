@@ -23,44 +23,87 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+from functools import lru_cache, partial
 from typing import Any
+import numpy as np
 
-def calculate_hand_value(hand: list) -> int:
+MAX_HAND_VALUE = 32  # Hit tables cover every reachable hand value (at most 21 + 10)
+
+try:
+    from _hand_value import calculate_hand_value
+except ImportError:  # Compiled extension not built, fall back to pure Python
+    def calculate_hand_value(hand: list) -> int:
         """Calculate the value of a hand in blackjack.
 
         Args:
-            hand (list): List of cards in the hand.
+            hand (list): List of card values in the hand (11 for an ace).
         Returns:
             int: Total value of the hand.
         """        
-        value = 0
-        aces = 0
-
-        for card in hand:
-            if card in ['J', 'Q', 'K']:
-                value += 10
-            elif card == 'A':
-                aces += 1
-                value += 11  # Initially count Ace as 11
-            else:
-                value += int(card)
-        # Adjust for Aces if value exceeds 21
-        while value > 21 and aces:
-            value -= 10
-            aces -= 1
+        value = sum(hand)  # Aces are initially counted as 11
+        aces = hand.count(11)
+        # Adjust for Aces if value exceeds 21, each softened ace takes off 10
+        if value > 21:
+            value -= 10 * min(aces, (value - 12) // 10)
         return value
 
-def basic(player_hand: list, dealer_upcard: str) -> bool:
+_calculate_hand_value_memo = lru_cache(maxsize=4096)(calculate_hand_value)
+
+def calculate_hand_value_cached(hand: list) -> int:
+    """Calculate the value of a hand, memoized on the multiset of its cards.
+
+    Meant for strategy training, which evaluates the same few hand compositions over and over.
+
+    Args:
+        hand (list): List of card values in the hand (11 for an ace).
+    Returns:
+        int: Total value of the hand.
+    """
+    return _calculate_hand_value_memo(tuple(sorted(hand)))
+
+def basic(player_hand: list, dealer_upcard: int) -> bool:
     """A simple player strategy: hit if hand value < 17, else stand.
     
     Args:
         player_hand (list): Player's hand.
-        dealer_upcard (str): Dealer's visible card.
+        dealer_upcard (int): Dealer's visible card value.
     Returns:
         bool: True to hit, False to stand.
     """
     return calculate_hand_value(player_hand) < 17
 
+# The basic strategy as a lookup table over the player's hand value
+BASIC_HIT_TABLE = np.arange(MAX_HAND_VALUE) < 17
+BASIC_HIT_TABLE.flags.writeable = False
+
+# Strategies that only depend on the hand value, mapped to their hit table
+HIT_TABLES = {basic: BASIC_HIT_TABLE}
+
+def hit_row(hit_table: np.ndarray, dealer_upcard: int) -> np.ndarray:
+    """Select the hit decisions over the player's hand value for a dealer upcard.
+
+    Args:
+        hit_table (np.ndarray): Boolean table indexed by player value, or by (player value, dealer upcard).
+        dealer_upcard (int): Dealer's visible card value.
+    Returns:
+        np.ndarray: Boolean view indexed by the player's hand value.
+    """
+    return hit_table if hit_table.ndim == 1 else hit_table[:, dealer_upcard]
+
+
+def hit_table_strategy(hit_table: np.ndarray, player_hand: list, dealer_upcard: int) -> bool:
+    """Decide by looking up a hit table, usable as a strategy via functools.partial.
+
+    Args:
+        hit_table (np.ndarray): Boolean table indexed by player value, or by (player value, dealer upcard).
+        player_hand (list): Player's hand.
+        dealer_upcard (int): Dealer's visible card value.
+    Returns:
+        bool: True to hit, False to stand. A busted hand always stands.
+    """
+    value = calculate_hand_value(player_hand)
+    return value <= 21 and bool(hit_row(hit_table, dealer_upcard)[value])
+
 
 class PlayerStrategy:
     """Class to encapsulate player strategy functions."""
@@ -72,18 +115,22 @@ class PlayerStrategy:
             n_card_decks (int): Number of decks to use in training the strategy.
         """ 
         self.n_card_decks = n_card_decks
-        self.strategy = self.train_strategy(n_card_decks)
+        self.hit_table = self.train_strategy(n_card_decks)
+        self.strategy = partial(hit_table_strategy, self.hit_table)
 
     def __call__(self, *args: Any, **kwds: Any) -> Any:
         return self.strategy(*args, **kwds)
 
-    def train_strategy(self, n_card_decks: int) -> callable:
+    def train_strategy(self, n_card_decks: int) -> np.ndarray:
         """Train a player strategy using reinforcement learning.
         
         Args:
             n_card_decks (int): Number of decks to use in training.
+        Returns:
+            np.ndarray: Boolean hit table of shape (MAX_HAND_VALUE,) indexed by the player's hand value,
+                or (MAX_HAND_VALUE, 12) indexed by player value and dealer upcard.
         """
         # TODO: add training logic here
 
         # TODO: for now, return basic strategy
-        return basic
\ No newline at end of file
+        return BASIC_HIT_TABLE
\ No newline at end of file
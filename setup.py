@@ -1,4 +1,24 @@
-from setuptools import setup
+import sys
+from setuptools import Extension, setup
+
+OPENMP_FLAGS = ["/openmp"] if sys.platform == "win32" else ["-fopenmp"]
+
+try:
+	from Cython.Build import cythonize
+	ext_modules = cythonize(
+		[
+			Extension("_hand_value", ["_hand_value.pyx"]),
+			Extension("_experiment", ["_experiment.pyx"], extra_compile_args=OPENMP_FLAGS, extra_link_args=OPENMP_FLAGS),
+		],
+		compiler_directives={"boundscheck": False, "wraparound": False, "cdivision": True},
+	)
+	# Compilers without OpenMP support (e.g. Apple clang) skip _experiment with a warning instead of
+	# failing the install; experiment_fast then falls back to experiment_jit. Set after cythonize,
+	# which does not carry the flag over to the extensions it returns.
+	for ext in ext_modules:
+		ext.optional = ext.name == "_experiment"
+except ImportError:  # Cython is optional, the modules fall back to pure Python or Numba
+	ext_modules = []
 
 setup(
 	name="blackjack-environment",
@@ -9,6 +29,7 @@ setup(
 	url="https://github.com/Krellner/blackjack_environment",
 	python_requires=">=3.9",
 	py_modules=["blackjack", "blackjack_strategies"],
+	ext_modules=ext_modules,
 	classifiers=[
 		"Programming Language :: Python :: 3",
 		"License :: OSI Approved :: MIT License",
@@ -16,6 +37,7 @@ setup(
 		"Intended Audience :: Developers",
 		"Topic :: Games/Entertainment :: Simulation",
 	],
-	install_requires=[],  # Add dependencies here when strategies require them
+	install_requires=["numpy>=1.22"],  # Generator.permuted is required for batched shuffling
+	extras_require={"jit": ["numba"]},
 )
 